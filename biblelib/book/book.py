@@ -294,6 +294,32 @@ class Books(UserDict):
         bookinst: Book = self.namemap[bookname]
         return bookinst
 
+    def matchname(self, ref: str) -> str:
+        """Return the book name at the start of a name reference.
+
+        Most references are a bare name, '<name>:<verse>' or '<name>
+        <rest>', so this tries dict lookups on those first, in that
+        order, and only falls back to nameregexp (which tries each
+        name in turn) if none is a known name. Checking before ':'
+        first keeps "Psalm 151:1" in Psalm 151, rather than taking the
+        "Psalm" alias for Psalms. Unlike nameregexp, this returns the full name for
+        names that extend another one, like "Esther Greek" rather than
+        "Esther", and handles names with parentheses like "1 Esdras
+        (Greek)".
+
+        Args:
+            ref: a reference starting with a book name, like "1
+                Corinthians 4:8".
+        """
+        if ref in self.namemap:
+            return ref
+        for bookname in (ref.split(":", 1)[0], ref.rsplit(" ", 1)[0]):
+            if bookname in self.namemap:
+                return bookname
+        namematch = self.nameregexp.match(ref)
+        assert namematch, f"Invalid name reference: {ref}"
+        return ref[: namematch.end()]
+
     def _ensure_osismap(self) -> dict[str, str]:
         """Generate the OSIS map if needed."""
         if not self.osismap:
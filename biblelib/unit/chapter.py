@@ -108,6 +108,18 @@ class Chapters(UserDict):
             self.data = {bcid: ChapterVerses(**row) for row in reader if (bcid := row["chapter_ID"])}
             # does not handle LJE correctly: only one chapter, indexed as 6
 
+    def lastverse(self, bcid: str) -> int:
+        """Return the index of the last verse in the chapter bcid.
+
+        Raises KeyError for a chapter that doesn't exist.
+        """
+        chapverses: ChapterVerses = self.data[bcid]
+        return chapverses.lastverse
+
+
+# static chapter verse data: load once and share
+CHAPTERS = Chapters()
+
 
 # TODO: cache these
 # parameter names here are confusing: "identifier" is really an
@@ -126,7 +138,7 @@ class Chapter(Unit):
     """
 
     _books = book.Books()
-    _chapters = Chapters()
+    _chapters = CHAPTERS
     # if defined, the parent instance: e.g. parent_chapter of Mark 4:3 is Mark 4
     # could also be parent sentence, paragraph, pericope ... so dict for extensibility
     # parent: dict[str, Any] = {}  # {"Book": None}
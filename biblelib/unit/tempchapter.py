@@ -3,9 +3,11 @@
 """
 
 from collections import UserList
-from csv import DictWriter
-from dataclasses import asdict
+from csv import writer as csvwriter
+from dataclasses import fields
+from operator import attrgetter
 from pathlib import Path
+from typing import TextIO
 
 from biblelib import book
 from biblelib.unit.book import BookChapters
@@ -1452,14 +1454,10 @@ class Manager(UserList):
         """
         super().__init__()
         self.data = [BookChapters.from_book_tuple(booktup) for booktup in self.rawdata]
-        fieldnames = asdict(self.data[0]).keys()
         outpath = self.cwd / outfile
         with outpath.open("w") as f:
             print(f"Writing {outpath}")
-            writer = DictWriter(f, fieldnames=fieldnames, delimiter="\t")
-            writer.writeheader()
-            for row in self.data:
-                writer.writerow(asdict(row))
+            self._write_rows(f, self.data)
 
     def write_verses(self, outfile="chapterverses.tsv") -> None:
         """Write start and end verses for each chapter."""
@@ -1471,8 +1469,17 @@ class Manager(UserList):
         outpath = self.cwd / outfile
         with outpath.open("w") as f:
             print(f"Writing chapter verses to {outpath}")
-            fieldnames = asdict(self.chapterversedata[0]).keys()
-            writer = DictWriter(f, fieldnames=fieldnames, delimiter="\t")
-            writer.writeheader()
-            for row in self.chapterversedata:
-                writer.writerow(asdict(row))
+            self._write_rows(f, self.chapterversedata)
+
+    @staticmethod
+    def _write_rows(f: TextIO, rows: list) -> None:
+        """Write a header and a TSV row for each dataclass instance in rows.
+
+        Columns are the dataclass fields, as with asdict(), but values
+        are read directly rather than copied into a dict per row.
+        """
+        fieldnames = [fld.name for fld in fields(rows[0])]
+        getrow = attrgetter(*fieldnames)
+        writer = csvwriter(f, delimiter="\t")
+        writer.writerow(fieldnames)
+        writer.writerows(getrow(row) for row in rows)
@@ -15,10 +15,9 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 from biblelib.book import Books
-from biblelib.word import BID, BCID, BCVID, simplify
-from .chapter import Chapter
+from biblelib.word import BID, BCID, BCVID
+from .chapter import CHAPTERS, Chapter
 from .verse import Verse
-from .unit import pad
 
 BOOKS = Books()
 
@@ -35,9 +34,9 @@ class ChapterRange:
 
     def __post_init__(self) -> None:
         """Check initialization values."""
-        assert simplify(self.startid, BID) == simplify(
-            self.endid, BID
-        ), f"startid {self.startid} and endid (self.endid) must be in the same book."
+        assert (
+            self.startid.book_ID == self.endid.book_ID
+        ), f"startid {self.startid} and endid {self.endid} must be in the same book."
         assert self.startid <= self.endid, f"Startid {self.startid} must equal or precede endid {self.endid}."
 
     def enumerate(self) -> list[Chapter]:
@@ -52,10 +51,9 @@ class ChapterRange:
             bookid = self.startid.book_ID
             # this assumes chapters are numbered sequentially
             # this may be violated outside the Protestant canon
-            startid_chap = int(self.startid.chapter_ID)
-            endid_chap = int(self.endid.chapter_ID)
-            chapters = list(range(startid_chap, endid_chap + 1))
-            return [Chapter(BCID(bookid + pad(i, 3))) for i in chapters]
+            startid_chap = self.startid.chapter_int
+            endid_chap = self.endid.chapter_int
+            return [Chapter(BCID(f"{bookid}{i:03}")) for i in range(startid_chap, endid_chap + 1)]
 
 
 @dataclass
@@ -82,8 +80,8 @@ class VerseRange:
         self.ID = self.startid.ID + "-" + self.endid.ID
         self.book: BID = BID(self.startid.to_bid)
         self.chapter: BCID = BCID(self.startid.to_bcid)
-        assert self.book == BID(
-            self.endid.to_bid
+        assert (
+            self.startid.book_ID == self.endid.book_ID
         ), f"Startid {self.startid} and endid {self.endid} must be in the same book."
         # note this allows a vacuous range with the same start and
         # end: does that make sense?
@@ -99,39 +97,29 @@ class VerseRange:
         Enumerations include the ending Verse value (unlike range).
         """
 
-        def get_verses(bcid: BCID, startindex: int, endindex: int) -> list[Verse]:
-            """Return a list of verses."""
-            return Chapter(inst=bcid).enumerate(startindex, endindex)
-
         if self.startid == self.endid:
             # vacuous range
             return [Verse(self.startid)]
         else:
             # this assumes chapters are numbered sequentially
             # this may be violated outside the Protestant canon
-            startid_chap_index = int(self.startid.chapter_ID)
-            startid_verse_index = int(self.startid.verse_ID)
-            endid_chap_index = int(self.endid.chapter_ID)
-            endid_verse_index = int(self.endid.verse_ID)
-            if startid_chap_index == endid_chap_index:
-                chap = Chapter(inst=simplify(self.startid, BCID))
-                return chap.enumerate(startid_verse_index, endid_verse_index)
-            else:
-                # bookid = self.startid.book_ID
-                chaprange = ChapterRange(startid=simplify(self.startid, BCID), endid=simplify(self.endid, BCID))
-                chapenum = chaprange.enumerate()
-                firstbcid = chapenum[0].identifier
-                firstchap = Chapter(inst=firstbcid)
-                firstverses = get_verses(firstbcid, startid_verse_index, firstchap.lastverse)
-                # may be empty
-                midbcids: list[Chapter] = chapenum[1:-1]
-                # get all verses for any middle chapters
-                # WRONG use of get_verses here now that this is a list of Chapters
-                midverses = [v for chap in midbcids for v in chap.enumerate(1, chap.lastverse)]
-                lastbcid = chapenum[-1].identifier
-                # lastchap = Chapter(inst=lastbcid)
-                lastverses = get_verses(lastbcid, 1, endid_verse_index)
-                return [v for v in (firstverses + midverses + lastverses)]
+            startid_chap_index = self.startid.chapter_int
+            startid_verse_index = self.startid.verse_int
+            endid_chap_index = self.endid.chapter_int
+            endid_verse_index = self.endid.verse_int
+            bookid = self.startid.book_ID
+            # build the Verse instances straight from CHAPTERS: a
+            # Chapter would enumerate all of its verses on
+            # construction, whether or not they're in the range
+            verses: list[Verse] = []
+            for chapindex in range(startid_chap_index, endid_chap_index + 1):
+                bcid = f"{bookid}{chapindex:03}"
+                # KeyError for a chapter that doesn't exist, as Chapter() gives
+                chaplastverse = CHAPTERS.lastverse(bcid)
+                firstverse = startid_verse_index if chapindex == startid_chap_index else 1
+                lastverse = endid_verse_index if chapindex == endid_chap_index else chaplastverse
+                verses.extend(Verse(BCVID(f"{bcid}{v:03}")) for v in range(firstverse, lastverse + 1))
+            return verses
 
     def enumerate_ids(self) -> list[BCVID | None]:
         """Return a list of BCVID instances for the range."""
@@ -147,10 +135,7 @@ def detect_name_range(ref: str) -> str:
     """
     ref1, ref2 = ref.split("-")
     assert not ("," in ref1 or "," in ref2), f"Can't handle complex range: {ref}"
-    namematch = BOOKS.nameregexp.match(ref1)
-    assert namematch, f"Invalid name reference: {ref1}"
-    bookname, _ = ref1[: namematch.end()], ref1[(namematch.end() + 1) :]
-    usfmbook = BOOKS.fromname(bookname).usfmnumber
+    usfmbook = BOOKS.fromname(BOOKS.matchname(ref1)).usfmnumber
     if ":" in ref1:
         return f"{usfmbook}, verserange"
     else:
@@ -53,7 +53,9 @@ ToDo:
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 import re
+import sys
 from typing import Any, Union, get_args
 
 from biblelib.book import Books
@@ -176,6 +178,11 @@ class BCID(BID):
         """Return string for the book and chapter ID."""
         return self.book_ID + self.chapter_ID
 
+    @cached_property
+    def chapter_int(self) -> int:
+        """Return the chapter number as an int, computed once."""
+        return int(self.chapter_ID)
+
     def includes(self, other: Any) -> bool:
         """Return True if other is included in the scope of self.
 
@@ -242,6 +249,11 @@ class BCVID(BCID):
         """Return string for the book, chapter, and verse ID."""
         return self.book_ID + self.chapter_ID + self.verse_ID
 
+    @cached_property
+    def verse_int(self) -> int:
+        """Return the verse number as an int, computed once."""
+        return int(self.verse_ID)
+
     def get_id(self) -> str:
         """Return BCVID string. For compatibility with BCVWPID."""
         return self.to_bcvid
@@ -353,6 +365,17 @@ class BCVIDRange:
             ]
 
 
+def _get_canon_prefix(book_ID: str) -> str:
+    """Return a single character prefix for canon."""
+    if book_ID < "40":
+        return "o"
+    elif book_ID < "67":
+        return "n"
+    else:
+        # not sure what's required here
+        return "x"
+
+
 @dataclass(repr=False, unsafe_hash=True)
 class BCVWPID(BCVID):
     """Identifies words from Bible texts by book, chapter, verse, word, and word part.
@@ -411,16 +434,6 @@ class BCVWPID(BCVID):
 
         """
 
-        def _get_canon_prefix(book_ID: str) -> str:
-            """Return a single character prefix for canon."""
-            if book_ID < "40":
-                return "o"
-            elif book_ID < "67":
-                return "n"
-            else:
-                # not sure what's required here
-                return "x"
-
         # cannot call super because allows either 11 or 12 length
         # super()__post_init__()
         idpat = re.compile(r"^[no]?\d{11,12}$")
@@ -436,10 +449,12 @@ class BCVWPID(BCVID):
             # don't include canon prefix in the ID: decide that at
             # output time with get_id().
             # self.ID = self.canon_prefix + self.ID
-        self.book_ID = restid[0:2]
+        # book and chapter IDs come from small closed sets, so share
+        # one string object per value across instances
+        self.book_ID = sys.intern(restid[0:2])
         # TODO: add tests, presumably a closed set of values
         assert self.canon_prefix == _get_canon_prefix(self.book_ID), f"Canon prefix must match book ID: {self.ID}"
-        self.chapter_ID = restid[2:5]
+        self.chapter_ID = sys.intern(restid[2:5])
         self.verse_ID = restid[5:8]
         self.word_ID = restid[8:11]
         if len(restid) == 12:
@@ -448,6 +463,34 @@ class BCVWPID(BCVID):
             self.part_ID = "1"
             self.ID += self.part_ID
 
+    @classmethod
+    def from_raw(cls, ID: str) -> "BCVWPID":
+        """Return an instance for a trusted, well-formed identifier.
+
+        Skips the validation in __post_init__, so only use this for
+        identifiers from trusted sources like the Macula mapping
+        files. As with the regular constructor, ID may have a canon
+        prefix and may omit the part index.
+
+        """
+        inst = cls.__new__(cls)
+        if ID[0] in "on":
+            inst.canon_prefix = ID[0]
+            ID = ID[1:]
+        else:
+            inst.canon_prefix = _get_canon_prefix(ID[0:2])
+        inst.book_ID = sys.intern(ID[0:2])
+        inst.chapter_ID = sys.intern(ID[2:5])
+        inst.verse_ID = ID[5:8]
+        inst.word_ID = ID[8:11]
+        inst.part_ID = ID[11:12] or "1"
+        inst.ID = ID[:11] + inst.part_ID
+        # match what the dataclass __init__ sets: BCVWPID's own
+        # _idlen = 11 isn't annotated, so it isn't a field default, and
+        # __init__ uses the inherited BCVID default of 8
+        inst._idlen = BCVID._idlen
+        return inst
+
     def get_id(self, prefix: bool = False, part_index: bool = True) -> str:
         """Return a string identifier for the instance.
 
@@ -638,17 +681,14 @@ def fromname(ref: str) -> BID | BCID | BCVID:
 
     """
     # complex check because book names can contain spaces and other numbers
-    # must match a regexp of all the book names, and be the same length
-    # type complaint here: 'str' has no attribute 'match'. Not quite right.
-    namematch = BOOKS.nameregexp.match(ref)
-    assert namematch, f"Invalid name reference: {ref}"
-    if len(ref) == (namematch.end() - namematch.start()):
+    bookname = BOOKS.matchname(ref)
+    if bookname == ref:
         # book only
         usfmbook = BOOKS.fromname(ref).usfmnumber
         return BID((usfmbook))
     else:
-        # split namematch at the end of the match
-        bookname, rest = ref[: namematch.end()], ref[(namematch.end() + 1) :]
+        # split at the end of the book name
+        rest = ref[(len(bookname) + 1) :]
         usfmbook = BOOKS.fromname(bookname).usfmnumber
         if ":" not in rest:
             # book and chapter
@@ -702,7 +742,8 @@ def fromubs(ref: str) -> list[BCVID | BCVWPID]:
     macularefs = mpr.to_macula(ref)
     reflist: list[BCVID | BCVWPID] = []
     if macularefs:
-        reflist = [BCVWPID(r) for r in macularefs]
+        # mapping files are trusted, so skip validation
+        reflist = [BCVWPID.from_raw(r) for r in macularefs]
     elif ref.endswith("0000"):
         # verse-level reference
         # drop leading digit
@@ -26,15 +26,20 @@ Examples:
 """
 
 from collections import UserList
-from csv import DictReader
-from dataclasses import dataclass
+from csv import reader as csvreader
+from dataclasses import dataclass, fields
 from io import StringIO
+import os
+from pathlib import Path
+import pickle
 import requests
+from tempfile import NamedTemporaryFile
+from typing import Iterable, Iterator, Optional
 from unicodedata import normalize
 from warnings import warn
 
 
-@dataclass
+@dataclass(slots=True)
 class GNTMapping:
     """Dataclass mapping words across various Greek NTs.
 
@@ -43,6 +48,11 @@ class GNTMapping:
     BBCCCVVVWWW identifier (no canon prefix or word part). Text values
     are UTF-8 encoded, with final punctuation attached.
 
+    Uses slots, since there are ~138k instances in a typical
+    GNTMappings. This is a dataclass rather than a NamedTuple because
+    __post_init__ adds corpus prefixes and normalizes text on every
+    construction.
+
     Attributes:
         NA1904_ID: the identifier for this word in Nestle-Aland 1904
         NA1904_Text: the word form in Nestle-Aland 1904
@@ -97,23 +107,131 @@ class GNTMappings(UserList):
     """Manage a sequence of GNTMapping instances."""
 
     gitmappings = "https://raw.githubusercontent.com/Clear-Bible/macula-greek/main/sources/Clear/mappings/mappings-GNT-stripped.tsv"
+    # computed once: column headers in the source TSV must match
+    mappingfields: tuple = tuple(f.name for f in fields(GNTMapping))
+    # identifies the layout of pickled caches: bump the version when
+    # GNTMapping changes in ways that would break older caches
+    cachetag: tuple = ("GNTMapping", 1, mappingfields)
 
     def __init__(self, sourcefile: str = "") -> None:
-        """Initialize GNTMappings."""
+        """Initialize GNTMappings.
+
+        Reads sourcefile if provided, otherwise the content at
+        gitmappings. A local sourcefile is cached as a pickle file
+        next to it (see _load_cached()), to speed up later loads. All
+        rows are kept in memory: use iter_mappings() instead for a
+        single pass.
+
+        """
         super().__init__()
-        r = requests.get(self.gitmappings)
-        assert r.status_code == 200, f"Failed to get content from {self.gitmappings}"
-        # read the stream into a list of GNTMapping instances
-        tablestr = StringIO(r.text)
-        reader: DictReader = DictReader(tablestr, dialect="excel-tab")
-        # for row in reader:
-        #     self.data: list = [GNTMapping(**r) for r in reader]
-        self.data: list = [GNTMapping(**r) for r in reader]
+        if sourcefile:
+            self.data: list = self._load_cached(Path(sourcefile))
+        else:
+            # everything is kept anyway, so read the whole response at
+            # once: splitting a StringIO is much faster than streaming
+            # with iter_lines(), which splits chunks in Python
+            # Not parallelized: Mapper instantiates this at import time,
+            # where starting worker processes isn't safe, and pickling
+            # the rows back from workers costs more than parsing them.
+            r = requests.get(self.gitmappings)
+            assert r.status_code == 200, f"Failed to get content from {self.gitmappings}"
+            self.data = list(self._read_rows(StringIO(r.text)))
         # map MARBLE IDs to a GNTMapping instance
         self.marble_ids: dict[str, GNTMapping] = {}
         # map NA28 IDs to a GNTMapping instance
         self.na28_ids: dict[str, GNTMapping] = {}
 
+    @classmethod
+    def _load_cached(cls, sourcepath: Path) -> list[GNTMapping]:
+        """Return mappings from sourcepath, using a pickle cache alongside it.
+
+        The cache is <stem>.gntmappings.pkl in the same directory. It
+        is rebuilt when it's older than sourcepath, can't be read, or
+        was written with a different cachetag. Failure to write the
+        cache only warns.
+
+        """
+        cachepath = sourcepath.with_name(f"{sourcepath.stem}.gntmappings.pkl")
+        if cachepath.exists() and cachepath.stat().st_mtime >= sourcepath.stat().st_mtime:
+            # any failure to read the cache falls back to re-parsing
+            try:
+                with cachepath.open("rb") as f:
+                    # the tag is pickled separately, so it can be
+                    # checked before unpickling rows from another layout
+                    tag = pickle.load(f)
+                    if tag == cls.cachetag:
+                        cached: list[GNTMapping] = pickle.load(f)
+                        return cached
+                warn(f"Ignoring cache {cachepath} with tag {tag}, expected {cls.cachetag}")
+            except Exception as e:
+                warn(f"Ignoring unreadable cache {cachepath}: {e!r}")
+        data = list(cls.iter_mappings(str(sourcepath)))
+        # write to a temporary file and then replace, so an
+        # interrupted write never leaves a truncated cache
+        tmppath: Optional[Path] = None
+        try:
+            with NamedTemporaryFile("wb", dir=cachepath.parent, prefix=cachepath.name, delete=False) as f:
+                tmppath = Path(f.name)
+                pickle.dump(cls.cachetag, f, protocol=5)
+                pickle.dump(data, f, protocol=5)
+            os.replace(tmppath, cachepath)
+        except OSError as e:
+            warn(f"Failed to write cache {cachepath}: {e}")
+            if tmppath:
+                tmppath.unlink(missing_ok=True)
+        return data
+
+    @classmethod
+    def iter_mappings(cls, sourcefile: str = "") -> Iterator[GNTMapping]:
+        """Yield GNTMapping instances one row at a time.
+
+        Reads sourcefile if provided, otherwise streams the content at
+        gitmappings, so memory use doesn't grow with the number of
+        rows.
+
+        """
+        if sourcefile:
+            with Path(sourcefile).open(encoding="utf-8", newline="") as f:
+                yield from cls._read_rows(f)
+        else:
+            with requests.get(cls.gitmappings, stream=True) as r:
+                assert r.status_code == 200, f"Failed to get content from {cls.gitmappings}"
+                r.encoding = "utf-8"
+                yield from cls._read_rows(r.iter_lines(decode_unicode=True))
+
+    @classmethod
+    def _read_rows(cls, lines: Iterable[str]) -> Iterator[GNTMapping]:
+        """Yield a GNTMapping for each row of TSV lines, after checking the header."""
+        reader = csvreader(lines, dialect="excel-tab")
+        # a bare next() would raise StopIteration inside this
+        # generator, which surfaces as an unhelpful RuntimeError
+        firstrow = next(reader, None)
+        assert firstrow is not None, "Empty mappings source: no header row"
+        header = tuple(firstrow)
+        assert header == cls.mappingfields, f"Fieldname discrepancy header: {header} vs {cls.mappingfields}"
+        # rows are in mappingfields order, so construct positionally
+        for row in reader:
+            # skip blank lines, as DictReader does
+            if row:
+                yield GNTMapping(*row)
+
+    def _index(self, fieldname: str, label: str) -> dict[str, GNTMapping]:
+        """Return a dict mapping values of fieldname to GNTMapping instances.
+
+        Rows with an empty value are skipped. Warns on duplicate
+        values, using label for the kind of ID: the last one wins.
+
+        """
+        index: dict[str, GNTMapping] = {}
+        for mapping in self.data:
+            key = getattr(mapping, fieldname)
+            # only store if there's actually an ID
+            if key:
+                if key in index:
+                    warn(f"Duplicate {label} {key} in {mapping}")
+                index[key] = mapping
+        return index
+
     def marble2sblgnt(self, marbleid: str) -> str:
         """Return an SBLGNT ID for a MARBLE ID.
 
@@ -123,13 +241,7 @@ class GNTMappings(UserList):
         """
         # lazy initialization of the dictionary
         if not self.marble_ids:
-            for mapping in self.data:
-                thismarbleid = mapping.MARBLE_ID
-                if thismarbleid:
-                    # only store if there's actually an ID
-                    if thismarbleid in self.marble_ids:
-                        warn(f"Duplicate MARBLE ID {thismarbleid} in {mapping}")
-                    self.marble_ids[thismarbleid] = mapping
+            self.marble_ids = self._index("MARBLE_ID", "MARBLE ID")
         mapping = self.marble_ids.get(marbleid)
         mappedstr: str = mapping.SBLGNT_ID if mapping else ""
         return mappedstr
@@ -143,13 +255,7 @@ class GNTMappings(UserList):
         """
         # lazy initialization of the dictionary
         if not self.na28_ids:
-            for mapping in self.data:
-                thisna28id = mapping.NA28_ID
-                if thisna28id:
-                    # only store if there's actually an ID
-                    if thisna28id in self.na28_ids:
-                        warn(f"Duplicate NA28 ID {thisna28id} in {mapping}")
-                    self.na28_ids[thisna28id] = mapping
+            self.na28_ids = self._index("NA28_ID", "NA28 ID")
         mapping = self.na28_ids.get(na28id)
         mappedstr: str = mapping.SBLGNT_ID if mapping else ""
         return mappedstr
@@ -33,7 +33,8 @@ import requests
 from warnings import warn
 
 
-@dataclass
+# slots: there is one instance per Hebrew token
+@dataclass(slots=True)
 class WLCMMapping:
     """Dataclass mapping words across Macula Hebrew and MARBLE.
 
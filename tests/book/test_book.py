@@ -105,3 +105,30 @@ class TestMark(object):
         assert name2cor.usfmname == "2CO"
         assert self.allbooks.nameregexp.match("1 Corinthians 13")
         assert self.allbooks.nameregexp.match("1 Corinthians 13:1")
+
+    def test_matchname(self) -> None:
+        """Test matchname()."""
+        assert self.allbooks.matchname("Genesis") == "Genesis"
+        assert self.allbooks.matchname("1 John") == "1 John"
+        assert self.allbooks.matchname("1 Corinthians 13") == "1 Corinthians"
+        assert self.allbooks.matchname("Song of Songs 2:1") == "Song of Songs"
+        # falls back to the regexp
+        assert self.allbooks.matchname("Mark 4:3 8") == "Mark"
+
+    def test_matchname_full_names(self) -> None:
+        """Test matchname() returns names that extend another book name.
+
+        nameregexp stops at the first alternative that matches, so it
+        truncates these, or doesn't match names with parentheses.
+        """
+        assert self.allbooks.matchname("Esther Greek 3") == "Esther Greek"
+        assert self.allbooks.matchname("Psalms of Solomon 1") == "Psalms of Solomon"
+        assert self.allbooks.matchname("Daniel Greek 3:1") == "Daniel Greek"
+        assert self.allbooks.matchname("Ezra Apocalypse 2") == "Ezra Apocalypse"
+        assert self.allbooks.matchname("Psalms 152-155 1") == "Psalms 152-155"
+        assert self.allbooks.matchname("1 Esdras (Greek) 2") == "1 Esdras (Greek)"
+        # a book, not the "Psalm" alias for Psalms
+        assert self.allbooks.matchname("Psalm 151") == "Psalm 151"
+        assert self.allbooks.matchname("Psalm 151:1") == "Psalm 151"
+        assert self.allbooks.matchname("Psalm 151 2:1") == "Psalm 151"
+        assert self.allbooks.matchname("Psalm 23:1") == "Psalm"
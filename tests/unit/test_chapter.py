@@ -1,6 +1,6 @@
 """Pytest tests for biblelib.unit.chapter."""
 
-# import pytest
+import pytest
 
 from biblelib.word import BCID
 from biblelib.unit import chapter
@@ -31,6 +31,13 @@ class TestChapters:
         assert self.chpts["01001"].chapter_ID == "01001"
         assert self.chpts["01001"].end_ID == "01001031"
 
+    def test_lastverse(self) -> None:
+        """Test for lastverse()."""
+        assert self.chpts.lastverse("41004") == 41
+        assert self.chpts.lastverse("66022") == 21
+        with pytest.raises(KeyError):
+            self.chpts.lastverse("41099")
+
 
 class TestChapter(object):
     """Test basic functionality for chapters."""
@@ -89,3 +89,27 @@ class TestVerseRange(object):
         assert isinstance(enumerated[0], Verse)
         # vacuous range
         assert len(enumerated) == 36
+        # MRK 1:40-45, all of MRK 2, MRK 3:1-2
+        assert enumerated[0] == Verse(BCVID("41001040"))
+        assert enumerated[5] == Verse(BCVID("41001045"))
+        assert enumerated[6] == Verse(BCVID("41002001"))
+        assert enumerated[33] == Verse(BCVID("41002028"))
+        assert enumerated[-1] == Verse(BCVID("41003002"))
+
+
+class TestDetectNameRange(object):
+    """Test basic functionality for detect_name_range."""
+
+    def test_detect_name_range(self) -> None:
+        """Test detect_name_range."""
+        assert unitrange.detect_name_range("Mark 4:3-8") == "41, verserange"
+        assert unitrange.detect_name_range("1 Corinthians 4-6") == "46, chapterrange"
+        assert unitrange.detect_name_range("Song of Songs 2:1-3") == "22, verserange"
+        # common variant name
+        assert unitrange.detect_name_range("Psalm 23:1-3") == "19, verserange"
+        # names that extend another book name: not Esther or Psalms
+        assert unitrange.detect_name_range("Esther Greek 3-4") == "70, chapterrange"
+        assert unitrange.detect_name_range("Psalms of Solomon 1:1-3") == "87, verserange"
+        assert unitrange.detect_name_range("Psalm 151:1-3") == "85, verserange"
+        with pytest.raises(Exception):
+            unitrange.detect_name_range("Nonesuch 4:3-8")
@@ -1,5 +1,10 @@
 """Test biblelib.word.mappings."""
 
+from pathlib import Path
+import pickle
+
+import pytest
+
 from biblelib.word.mappings import GNTMapping, GNTMappings
 
 
@@ -15,6 +20,18 @@ TESTMAPPING = GNTMapping(
 )
 
 
+@pytest.fixture
+def sourcefile(tmp_path: Path) -> Path:
+    """Return a local mappings file with a single row for TESTMAPPING."""
+    sourcefile = tmp_path / "mappings.tsv"
+    header = "\t".join(GNTMappings.mappingfields)
+    row = "\t".join(
+        ["43001001005", "Λόγος,", "43001001005", "43001001005", "43001001005", "λόγος,", "04300100100010"]
+    )
+    sourcefile.write_text(f"{header}\n{row}\n", encoding="utf-8")
+    return sourcefile
+
+
 class TestGNTMapping:
     """Test basic functionality of GNTMapping dataclass."""
 
@@ -30,6 +47,58 @@ class TestGNTMappings:
 
     gnt = GNTMappings()
 
+    def test_iter_mappings(self, sourcefile: Path) -> None:
+        """Test streaming mappings from a local file."""
+        mappings = list(GNTMappings.iter_mappings(str(sourcefile)))
+        assert len(mappings) == 1
+        # corpus prefixes are added
+        assert mappings[0] == TESTMAPPING
+
+    def test_iter_mappings_empty(self, tmp_path: Path) -> None:
+        """Test an empty source fails with a clear error."""
+        emptyfile = tmp_path / "empty.tsv"
+        emptyfile.write_text("", encoding="utf-8")
+        with pytest.raises(AssertionError, match="Empty mappings source"):
+            list(GNTMappings.iter_mappings(str(emptyfile)))
+        with pytest.raises(AssertionError, match="Empty mappings source"):
+            GNTMappings(str(emptyfile))
+
+    def test_init_cached(self, sourcefile: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test loading from a local file writes and reuses a cache."""
+        gnt = GNTMappings(str(sourcefile))
+        cachepath = sourcefile.with_name("mappings.gntmappings.pkl")
+        assert cachepath.exists()
+
+        # the second load must come from the cache, not the TSV
+        def fail(*args: object) -> None:
+            raise AssertionError("should have read the cache")
+
+        monkeypatch.setattr(GNTMappings, "iter_mappings", fail)
+        cached = GNTMappings(str(sourcefile))
+        assert cached.data == gnt.data == [TESTMAPPING]
+        assert cached.na282sblgnt("43001001005") == "n43001001005"
+
+    def test_init_cached_invalid(self, sourcefile: Path) -> None:
+        """Test truncated or mismatched caches are ignored and rewritten."""
+        GNTMappings(str(sourcefile))
+        cachepath = sourcefile.with_name("mappings.gntmappings.pkl")
+        cachebytes = cachepath.read_bytes()
+        cachepath.write_bytes(cachebytes[: len(cachebytes) // 2])
+        with pytest.warns(UserWarning, match="unreadable cache"):
+            assert GNTMappings(str(sourcefile)).data == [TESTMAPPING]
+        # rewritten with the full data
+        assert cachepath.read_bytes() == cachebytes
+        # a cache with a different tag
+        cachepath.write_bytes(pickle.dumps(("GNTMapping", 0), protocol=5) + pickle.dumps([], protocol=5))
+        with pytest.warns(UserWarning, match="Ignoring cache"):
+            assert GNTMappings(str(sourcefile)).data == [TESTMAPPING]
+        # a current tag, but rows that reference a module that no longer exists
+        cachepath.write_bytes(pickle.dumps(GNTMappings.cachetag, protocol=5) + b"cnonexistent_module\nGNTMapping\n.")
+        with pytest.warns(UserWarning, match="ModuleNotFoundError"):
+            assert GNTMappings(str(sourcefile)).data == [TESTMAPPING]
+        # no temporary files left behind
+        assert sorted(p.name for p in sourcefile.parent.iterdir()) == ["mappings.gntmappings.pkl", "mappings.tsv"]
+
     def test_init(self) -> None:
         """Test initialization: reading, and resulting list length."""
         # FRAGILE!
@@ -87,6 +87,12 @@ class TestFromName:
         assert fromname("Genesis 12") == BCID("01012")
         assert fromname("Psalms 119") == BCID("19119")
         assert fromname("Mark 4") == BCID("41004")
+        # names that extend another book name
+        assert fromname("Esther Greek 3") == BCID("70003")
+        # a book, not chapter 151 of Psalms
+        assert fromname("Psalm 151:1") == BCID("85001")
+        assert fromname("Psalms of Solomon 1") == BCID("87001")
+        assert fromname("1 Esdras (Greek) 2") == BCID("82002")
 
     def test_fromname_chapter_verse(self) -> None:
         """Test returned values"""
@@ -94,6 +100,7 @@ class TestFromName:
         assert fromname("Genesis 12:10") == BCVID("01012010")
         assert fromname("Psalms 119:1") == BCVID("19119001")
         assert fromname("Mark 4:1") == BCVID("41004001")
+        assert fromname("Daniel Greek 3:1") == BCVID("B2003001")
         with pytest.raises(AssertionError):
             # space not allowed here
             _ = fromname("1 Corinthians 13 3")
@@ -284,6 +291,11 @@ class TestBCVID:
         assert self.testid.to_bcid == "43001"
         assert self.testid.to_bcvid == self.NA1904_ID
         assert self.testid.get_id() == self.NA1904_ID
+        assert self.testid.chapter_int == 1
+        assert self.testid.verse_int == 1
+        # doesn't change equality or hashing
+        assert self.testid == BCVID(self.NA1904_ID)
+        assert hash(self.testid) == hash(BCVID(self.NA1904_ID))
 
     def test_hash(self) -> None:
         """Ensure hashable.
@@ -404,6 +416,24 @@ class TestBCVWPID:
         assert testid.word_ID == "001"
         assert testid.part_ID == "1"
 
+    def test_from_raw(self) -> None:
+        """Test from_raw() matches the regular constructor."""
+        for rawid in ["43001001005", "n43001001005", "010020030012", "o010020030011"]:
+            fromraw = BCVWPID.from_raw(rawid)
+            regular = BCVWPID(rawid)
+            assert fromraw == regular
+            assert fromraw.canon_prefix == regular.canon_prefix
+            assert fromraw.word_ID == regular.word_ID
+            assert fromraw.part_ID == regular.part_ID
+            assert hash(fromraw) == hash(regular)
+
+    def test_interned(self) -> None:
+        """Test book and chapter IDs are shared across instances."""
+        first = BCVWPID("43001001005")
+        second = BCVWPID.from_raw("n43001002007")
+        assert first.book_ID is second.book_ID
+        assert first.chapter_ID is second.chapter_ID
+
     def test_hash(self) -> None:
         """Ensure hashable.
 